@@ -26,63 +26,64 @@ def main():
     try:
         # Set up logging
         logger = setup_logging(log_level="INFO")
-        logger.info(f"Starting {APP_NAME} v{APP_VERSION}")
+        logger.info("Starting %s v%s", APP_NAME, APP_VERSION)
         
         # Load configuration
         logger.info("Loading configuration...")
         config = get_config()
-        logger.info(f"Configuration loaded successfully")
-        logger.info(f"Debug mode: {config.app.debug}")
-        logger.info(f"Log level: {config.app.log_level}")
+        logger.info("Configuration loaded successfully")
+        logger.info("Debug mode: %s", config.app.debug)
+        logger.info("Log level: %s", config.app.log_level)
         
-        # Display current status
-        print(f"\n🎤 {APP_NAME} v{APP_VERSION}")
-        print("=" * 40)
-        print(f"Status: {StatusMessages.READY}")
-        print(f"Debug Mode: {config.app.debug}")
-        print(f"Log Level: {config.app.log_level}")
-        print(f"Temp Directory: {config.app.temp_dir}")
-        print(f"Window Size: {config.app.window_size}")
-        
-        # Show API configuration (without exposing the key)
+        # Build the status banner and emit it with a single buffered write
+        # (one syscall instead of one per line, which matters on slow
+        # terminals)
         api_key_status = "✅ Configured" if config.api.openai_api_key else "❌ Missing"
-        print(f"OpenAI API Key: {api_key_status}")
-        print(f"Whisper Model: {config.api.whisper_model}")
-        print(f"GPT Model: {config.api.gpt_model}")
-        
-        # Show audio configuration
-        print(f"\n🔊 Audio Configuration:")
-        print(f"Sample Rate: {config.audio.sample_rate} Hz")
-        print(f"Channels: {config.audio.channels}")
-        print(f"Chunk Size: {config.audio.chunk_size}")
-        print(f"Format: {config.audio.format}")
-        print(f"Max Duration: {config.audio.max_duration}s")
-        
-        # Show development phase status
-        print(f"\n📋 Development Status:")
-        print("✅ Phase 1: Foundation Setup - COMPLETED")
-        print("🔄 Phase 2: Audio Processing - IN PROGRESS")
-        print("⏳ Phase 3: API Integration - PENDING")
-        print("⏳ Phase 4: GUI Implementation - PENDING")
-        print("⏳ Phase 5: Application Integration - PENDING")
-        
-        print(f"\n💡 Next Steps:")
-        print("1. Implement audio capture functionality")
-        print("2. Add OpenAI API integration")
-        print("3. Create GUI interface")
-        print("4. Integrate all components")
-        
-        # Show available commands (for future implementation)
-        print(f"\n🎯 Available Commands (Future):")
-        print("- Start/Stop Recording")
-        print("- Transcribe Audio")
-        print("- Clean Text with GPT")
-        print("- Save/Load Files")
-        
+        banner = "\n".join([
+            f"\n🎤 {APP_NAME} v{APP_VERSION}",
+            "=" * 40,
+            f"Status: {StatusMessages.READY}",
+            f"Debug Mode: {config.app.debug}",
+            f"Log Level: {config.app.log_level}",
+            f"Temp Directory: {config.app.temp_dir}",
+            f"Window Size: {config.app.window_size}",
+            # API configuration (without exposing the key)
+            f"OpenAI API Key: {api_key_status}",
+            f"Whisper Model: {config.api.whisper_model}",
+            f"GPT Model: {config.api.gpt_model}",
+            # Audio configuration
+            "\n🔊 Audio Configuration:",
+            f"Sample Rate: {config.audio.sample_rate} Hz",
+            f"Channels: {config.audio.channels}",
+            f"Chunk Size: {config.audio.chunk_size}",
+            f"Format: {config.audio.format}",
+            f"Max Duration: {config.audio.max_duration}s",
+            # Development phase status
+            "\n📋 Development Status:",
+            "✅ Phase 1: Foundation Setup - COMPLETED",
+            "🔄 Phase 2: Audio Processing - IN PROGRESS",
+            "⏳ Phase 3: API Integration - PENDING",
+            "⏳ Phase 4: GUI Implementation - PENDING",
+            "⏳ Phase 5: Application Integration - PENDING",
+            "\n💡 Next Steps:",
+            "1. Implement audio capture functionality",
+            "2. Add OpenAI API integration",
+            "3. Create GUI interface",
+            "4. Integrate all components",
+            # Available commands (for future implementation)
+            "\n🎯 Available Commands (Future):",
+            "- Start/Stop Recording",
+            "- Transcribe Audio",
+            "- Clean Text with GPT",
+            "- Save/Load Files",
+        ])
+        sys.stdout.write(banner + "\n")
+        sys.stdout.flush()
+
         # Create temp directory if it doesn't exist
         from utils.config import config_manager
         temp_dir = config_manager.create_temp_dir()
-        logger.info(f"Temp directory ready: {temp_dir}")
+        logger.info("Temp directory ready: %s", temp_dir)
         
         print(f"\n✅ Foundation setup verified successfully!")
         print("The application foundation is ready for Phase 2 development.")
@@ -91,17 +92,17 @@ def main():
         
     except ConfigurationError as e:
         print(f"❌ Configuration Error: {e}")
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return 1
         
     except V2TException as e:
         print(f"❌ Application Error: {e}")
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         return 1
         
     except Exception as e:
         print(f"❌ Unexpected Error: {e}")
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return 1
     
     return 0
@@ -0,0 +1,46 @@
+"""
+Ahead-of-Time Build Script for DSP Kernels
+
+Compiles the v2t_dsp native extension with Numba's pycc so that the
+first recording never pays JIT compile latency (seconds on first call,
+hundreds of ms even with a warm disk cache). When the built extension is
+importable, src/audio/dsp.py uses it automatically; otherwise it falls
+back to JIT or plain NumPy.
+
+Usage:
+    python src/audio/_build_aot.py
+
+The extension is written next to this script; there is no packaging hook
+yet, so run it manually (or from a future build step) on the target
+platform.
+"""
+
+from numba.pycc import CC
+
+cc = CC('v2t_dsp')
+
+_INT16_SCALE = 1.0 / 32768.0
+
+
+@cc.export('i16_to_f32', 'void(i2[:], f4[:])')
+def i16_to_f32(src, dst):
+    """Normalize int16 PCM into a preallocated float32 buffer."""
+    for i in range(src.shape[0]):
+        dst[i] = src[i] * _INT16_SCALE
+
+
+@cc.export('rms_i16', 'f4(i2[:])')
+def rms_i16(x):
+    """RMS level of int16 PCM, normalized to [0.0, 1.0]."""
+    n = x.shape[0]
+    if n == 0:
+        return 0.0
+    acc = 0.0
+    for i in range(n):
+        v = x[i] * _INT16_SCALE
+        acc += v * v
+    return (acc / n) ** 0.5
+
+
+if __name__ == '__main__':
+    cc.compile()
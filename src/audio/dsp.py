@@ -0,0 +1,110 @@
+"""
+Audio DSP Helpers
+
+Numeric kernels for preparing captured PCM for transcription. Kernels are
+JIT-compiled with Numba when it is installed (fusing conversion and
+scaling into one vectorized, parallel pass with no temporaries) and fall
+back to plain NumPy otherwise.
+"""
+
+import numpy as np
+
+# Prefer the AOT-compiled extension built by _build_aot.py: importing it
+# is a plain native extension load with no LLVM pipeline at runtime.
+try:
+    import v2t_dsp as _v2t_dsp
+    AOT_AVAILABLE = True
+except ImportError:
+    _v2t_dsp = None
+    AOT_AVAILABLE = False
+
+# Numba import with fallback for development
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Whisper expects float32 samples in [-1.0, 1.0)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _int16_to_float32_numpy(src: np.ndarray, dst: np.ndarray) -> None:
+    """NumPy fallback: convert and scale in one ufunc call into dst."""
+    np.multiply(src, _INT16_SCALE, out=dst, casting='unsafe')
+
+
+def _rms_int16_numpy(samples: np.ndarray) -> float:
+    """NumPy fallback RMS of int16 PCM, normalized to [0.0, 1.0]."""
+    if samples.size == 0:
+        return 0.0
+    scaled = samples.astype(np.float32) * _INT16_SCALE
+    return float(np.sqrt(np.mean(scaled * scaled)))
+
+
+if AOT_AVAILABLE:
+    _int16_to_float32 = _v2t_dsp.i16_to_f32
+    _rms_int16 = _v2t_dsp.rms_i16
+elif NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _int16_to_float32_jit(src, dst):  # pragma: no cover - compiled
+        for i in prange(src.shape[0]):
+            dst[i] = src[i] * (1.0 / 32768.0)
+
+    @njit(fastmath=True, cache=True)
+    def _rms_int16_jit(samples):  # pragma: no cover - compiled
+        n = samples.shape[0]
+        if n == 0:
+            return 0.0
+        acc = 0.0
+        for i in range(n):
+            v = samples[i] * (1.0 / 32768.0)
+            acc += v * v
+        return (acc / n) ** 0.5
+
+    _int16_to_float32 = _int16_to_float32_jit
+    _rms_int16 = _rms_int16_jit
+else:
+    _int16_to_float32 = _int16_to_float32_numpy
+    _rms_int16 = _rms_int16_numpy
+
+
+def int16_to_float32(src: np.ndarray, dst: np.ndarray) -> None:
+    """
+    Normalize int16 PCM samples into a preallocated float32 buffer.
+
+    Writes src / 32768.0 into dst without allocating temporaries, so the
+    caller can reuse one output buffer across recordings.
+
+    Args:
+        src: int16 samples to convert
+        dst: float32 output buffer, at least src.shape[0] elements
+    """
+    _int16_to_float32(src, dst[:src.shape[0]])
+
+
+def rms_int16(samples: np.ndarray) -> float:
+    """
+    Compute the RMS level of int16 PCM samples.
+
+    Intended for level metering while recording.
+
+    Args:
+        samples: int16 samples to measure
+
+    Returns:
+        RMS level normalized to [0.0, 1.0]
+    """
+    return float(_rms_int16(samples))
+
+
+def is_numba_available() -> bool:
+    """
+    Check if Numba is available for JIT-compiled kernels.
+
+    Returns:
+        True if Numba is available, False otherwise
+    """
+    return NUMBA_AVAILABLE
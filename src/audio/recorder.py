@@ -5,33 +5,150 @@ Handles microphone access, audio capture, and recording functionality.
 """
 
 import os
+import sys
 import wave
-import threading
+import weakref
 import time
+import queue
+import threading
 from pathlib import Path
 from typing import Optional, Callable, Any
 from dataclasses import dataclass
 
-# PyAudio import with fallback for development
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    pyaudio = None
-    PYAUDIO_AVAILABLE = False
+import numpy as np
+
+# PyAudio is imported lazily on first use so that importing this module
+# does not pay the PortAudio shared-library load cost (the CLI status path
+# never needs it).
+pyaudio = None
+PYAUDIO_AVAILABLE: Optional[bool] = None
 
 from ..utils.logging_config import get_logger
 from ..utils.config import get_config
-from ..utils.constants import AudioConstants, StatusMessages, ErrorMessages
+from ..utils.constants import AudioConstants, StatusMessages
 from ..utils.exceptions import (
-    AudioError, MicrophoneError, AudioProcessingError, 
+    AudioError, MicrophoneError, AudioProcessingError,
     AudioDeviceError, FileError
 )
+from .dsp import int16_to_float32
 
 logger = get_logger(__name__)
 
+# Sample width of paInt16 in bytes. pyaudio.get_sample_size(paInt16) is
+# a PortAudio FFI round-trip for a value that is always 2.
+_SAMPLE_WIDTH_INT16 = 2
+
+# Sentinels for the persistent saver thread: _REC_DONE marks the end of
+# one recording (the thread signals the drain and keeps running), None
+# shuts the thread down for good.
+_REC_DONE = object()
+
+# How many chunks to accumulate before each on_audio_data delivery
+# (~320 ms at the default 1024-frame chunk and 16 kHz). Listeners get
+# fewer, larger calls instead of one per chunk.
+_CB_BATCH_CHUNKS = 5
+
+
+def _ensure_pyaudio() -> bool:
+    """
+    Import PyAudio on first use.
+
+    Returns:
+        True if PyAudio is available, False otherwise
+    """
+    global pyaudio, PYAUDIO_AVAILABLE
+
+    if PYAUDIO_AVAILABLE is None:
+        try:
+            import pyaudio as _pyaudio
+            pyaudio = _pyaudio
+            PYAUDIO_AVAILABLE = True
+        except ImportError:
+            PYAUDIO_AVAILABLE = False
+
+    return PYAUDIO_AVAILABLE
+
+
+# Device enumeration cache shared across recorder instances. Enumerating
+# devices hits the host API (hundreds of ms on WASAPI/ALSA) and device
+# topology rarely changes, so it is done once per process.
+_DEVICE_CACHE: Optional[dict] = None
+
+
+def _cache_devices(pa) -> dict:
+    """
+    Enumerate all audio devices once and cache the results.
+
+    Args:
+        pa: Active PyAudio instance used for the enumeration
+
+    Returns:
+        Mapping of device index to device info dict
+    """
+    global _DEVICE_CACHE
+
+    if _DEVICE_CACHE is None:
+        _DEVICE_CACHE = {
+            i: pa.get_device_info_by_index(i)
+            for i in range(pa.get_device_count())
+        }
+        logger.debug("Cached info for %s audio devices", len(_DEVICE_CACHE))
+
+    return _DEVICE_CACHE
+
+
+def refresh_devices() -> None:
+    """Invalidate the device enumeration cache (e.g. after hotplugging)."""
+    global _DEVICE_CACHE
+    _DEVICE_CACHE = None
+
+
+def _terminate_pyaudio(pa) -> None:
+    """
+    Terminate a PyAudio instance, tolerating interpreter shutdown.
+
+    Module-level so the finalizer holds no reference to the recorder.
+    """
+    try:
+        pa.terminate()
+    except Exception:
+        pass
 
-@dataclass
+
+def _set_realtime_priority() -> None:
+    """
+    Raise the calling thread to realtime scheduling where the platform
+    allows it.
+
+    Keeps the audio consumer thread from being preempted between driver
+    callbacks under CPU contention. Falls back silently when the process
+    lacks the required privileges.
+    """
+    try:
+        if hasattr(os, "sched_setscheduler"):
+            priority = os.sched_get_priority_max(os.SCHED_FIFO) - 1
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            logger.debug("Recording thread elevated to SCHED_FIFO")
+        elif sys.platform == "darwin":
+            import ctypes
+            libc = ctypes.CDLL("libc.dylib", use_errno=True)
+            # 0x21 == QOS_CLASS_USER_INTERACTIVE
+            libc.pthread_set_qos_class_self_np(0x21, 0)
+            logger.debug("Recording thread elevated to USER_INTERACTIVE QoS")
+        elif sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            # 15 == THREAD_PRIORITY_TIME_CRITICAL
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15)
+            logger.debug("Recording thread elevated to TIME_CRITICAL")
+    except OSError as e:
+        logger.info(
+            "Could not raise recording thread priority: %s "
+            "(requires CAP_SYS_NICE or a realtime rlimit)", e
+        )
+
+
+@dataclass(slots=True)
 class RecordingState:
     """Represents the current state of audio recording."""
     is_recording: bool = False
@@ -49,18 +166,39 @@ class AudioRecorder:
     Provides methods for starting, stopping, and managing audio recording
     with proper error handling and device management.
     """
-    
-    def __init__(self, device_index: Optional[int] = None):
+
+    # Fixed attribute layout: no per-instance __dict__, and attribute
+    # access on the per-chunk paths is a slot offset instead of a dict
+    # probe. __weakref__ is needed for the weakref.finalize teardown.
+    __slots__ = (
+        'config', 'device_index', 'pyaudio_instance', 'stream', 'state',
+        '_device_info_cache', '_finalizer', '_stop_requested', '_wav', '_raw',
+        '_sample_rate', '_channels', '_chunk_size', '_max_duration',
+        '_capacity', '_pcm', '_write_idx', '_float_pcm', '_pa_buffer',
+        '_consume', '_cb_batch', '_cb_batch_target',
+        '_q', '_consumer_thread', '_enqueued', 'reuse_stream', '_drained',
+        'on_recording_started', 'on_recording_stopped',
+        'on_recording_error', 'on_audio_data',
+        '__weakref__',
+    )
+
+    def __init__(self, device_index: Optional[int] = None,
+                 reuse_stream: bool = True):
         """
         Initialize the AudioRecorder.
-        
+
         Args:
             device_index: Optional specific audio device index to use
-            
+            reuse_stream: Keep the PyAudio stream open across recordings.
+                Opening a stream is a driver round-trip costing hundreds
+                of ms on some hosts; reusing it makes back-to-back
+                recordings start in ~ms. Disable if the device must be
+                reselected between recordings.
+
         Raises:
             AudioError: If PyAudio is not available or initialization fails
         """
-        if not PYAUDIO_AVAILABLE:
+        if not _ensure_pyaudio():
             raise AudioError(
                 "PyAudio is not available. Please install PyAudio for audio recording.",
                 error_code="PYAUDIO_NOT_AVAILABLE"
@@ -68,13 +206,66 @@ class AudioRecorder:
         
         self.config = get_config()
         self.device_index = device_index
+        self.reuse_stream = reuse_stream
         self.pyaudio_instance: Optional[pyaudio.PyAudio] = None
         self.stream: Optional[pyaudio.Stream] = None
-        self.recording_thread: Optional[threading.Thread] = None
         self.state = RecordingState()
-        self.audio_frames: list = []
-        self._stop_event = threading.Event()
-        
+        self._device_info_cache: dict = {}
+        self._finalizer: Optional[weakref.finalize] = None
+        # Checked by the PortAudio callback; set by stop_recording so the
+        # callback returns paComplete on its next invocation.
+        self._stop_requested = False
+        # Open WAV writer while a recording is in progress (frames are
+        # streamed to disk as they arrive), plus the raw buffered file
+        # underneath it (wave does not close file objects passed to it)
+        self._wav: Optional[wave.Wave_write] = None
+        self._raw: Optional[Any] = None
+
+        # Bind the hot config values once; the recording loop reads them
+        # tens of times per second and each dotted chain is three dict
+        # probes. self.config stays around for cold paths.
+        audio = self.config.audio
+        self._sample_rate = audio.sample_rate
+        self._channels = audio.channels
+        self._chunk_size = audio.chunk_size
+        self._max_duration = audio.max_duration
+
+        # Preallocate the whole capture buffer once (sized for max_duration)
+        # instead of appending per-chunk bytes objects to a list. The worker
+        # writes through a cursor, and saving is one contiguous copy with no
+        # final b''.join.
+        self._capacity = audio.max_duration * audio.sample_rate * audio.channels
+        self._pcm = np.empty(self._capacity, dtype=np.int16)
+        self._write_idx = 0
+        # Matching float32 buffer for Whisper normalization, allocated once
+        # so get_normalized_audio never creates a full-size temporary.
+        self._float_pcm = np.empty(self._capacity, dtype=np.float32)
+
+        # Let PortAudio's internal thread buffer ahead of the consumer:
+        # the device buffer is larger than the chunk the worker reads, so
+        # GC pauses on the Python side don't cause overflows.
+        self._pa_buffer = max(2 * audio.chunk_size, 2048)
+
+        # Per-chunk consumer selected at start_recording based on whether
+        # on_audio_data is registered; the callback makes one direct
+        # bound-method call with no attribute test per chunk.
+        self._consume: Callable[[bytes], None] = self._consume_noop
+        self._cb_batch = bytearray()
+        self._cb_batch_target = _CB_BATCH_CHUNKS * audio.chunk_size * audio.channels * 2
+
+        # Hand-off from the PortAudio callback to the saver thread.
+        # SimpleQueue's put is C-implemented and lock-free on the hot
+        # path, so the callback only enqueues and returns; all Python
+        # work (buffer copy, file write, listener dispatch) happens on
+        # the consumer side. The saver thread persists across recordings;
+        # _REC_DONE ends one recording, None shuts the thread down.
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._consumer_thread: Optional[threading.Thread] = None
+        self._enqueued = 0
+        # Set by the saver thread once a recording's chunks are flushed
+        self._drained = threading.Event()
+
+
         # Callbacks
         self.on_recording_started: Optional[Callable] = None
         self.on_recording_stopped: Optional[Callable] = None
@@ -83,10 +274,16 @@ class AudioRecorder:
         
         logger.info("AudioRecorder initialized")
     
-    def initialize_pyaudio(self) -> None:
+    def initialize_pyaudio(self, probe: bool = False) -> None:
         """
         Initialize PyAudio instance and verify microphone access.
-        
+
+        Args:
+            probe: Also ask the host API whether the configured format is
+                supported. The query hits the audio driver, so the default
+                fast path trusts the cached device info and lets
+                start_recording surface format problems when they occur.
+
         Raises:
             MicrophoneError: If microphone initialization fails
             AudioDeviceError: If no audio devices are available
@@ -94,6 +291,11 @@ class AudioRecorder:
         try:
             if self.pyaudio_instance is None:
                 self.pyaudio_instance = pyaudio.PyAudio()
+                # Deterministic teardown without __del__: runs once, at a
+                # predictable point, with no cyclic-GC involvement.
+                self._finalizer = weakref.finalize(
+                    self, _terminate_pyaudio, self.pyaudio_instance
+                )
                 logger.info("PyAudio instance created successfully")
             
             # Verify device access
@@ -103,18 +305,22 @@ class AudioRecorder:
                     "No audio devices found",
                     error_code="NO_AUDIO_DEVICES"
                 )
-            
+
+            # Later lookups hit the process-wide enumeration cache instead
+            # of making PortAudio FFI round-trips per call.
+            self._device_info_cache = _cache_devices(self.pyaudio_instance)
+
             # Find suitable input device if not specified
             if self.device_index is None:
                 self.device_index = self._find_default_input_device()
             
             # Verify the selected device
-            self._verify_device_access()
+            self._verify_device_access(probe=probe)
             
-            logger.info(f"PyAudio initialized with device index: {self.device_index}")
+            logger.info("PyAudio initialized with device index: %s", self.device_index)
             
         except Exception as e:
-            logger.error(f"Failed to initialize PyAudio: {e}")
+            logger.error("Failed to initialize PyAudio: %s", e)
             if isinstance(e, (AudioError, MicrophoneError, AudioDeviceError)):
                 raise
             raise MicrophoneError(
@@ -137,17 +343,16 @@ class AudioRecorder:
             default_device = self.pyaudio_instance.get_default_input_device_info()
             device_index = default_device['index']
             
-            logger.info(f"Found default input device: {default_device['name']}")
+            logger.info("Found default input device: %s", default_device['name'])
             return device_index
             
         except OSError:
             # Fallback: search for any input device
             logger.warning("No default input device found, searching for alternatives")
             
-            for i in range(self.pyaudio_instance.get_device_count()):
-                device_info = self.pyaudio_instance.get_device_info_by_index(i)
+            for i, device_info in self._device_info_cache.items():
                 if device_info['maxInputChannels'] > 0:
-                    logger.info(f"Using input device: {device_info['name']}")
+                    logger.info("Using input device: %s", device_info['name'])
                     return i
             
             raise AudioDeviceError(
@@ -155,16 +360,20 @@ class AudioRecorder:
                 error_code="NO_INPUT_DEVICE"
             )
     
-    def _verify_device_access(self) -> None:
+    def _verify_device_access(self, probe: bool = False) -> None:
         """
         Verify that we can access the selected audio device.
-        
+
+        Args:
+            probe: Also query the host API for format support instead of
+                trusting the cached device info alone
+
         Raises:
             MicrophoneError: If device access verification fails
         """
         try:
-            device_info = self.pyaudio_instance.get_device_info_by_index(self.device_index)
-            
+            device_info = self._device_info_cache[self.device_index]
+
             # Check if device supports input
             if device_info['maxInputChannels'] == 0:
                 raise MicrophoneError(
@@ -172,23 +381,27 @@ class AudioRecorder:
                     error_code="DEVICE_NO_INPUT",
                     device_info=device_info
                 )
-            
-            # Try to create a test stream to verify access
-            test_stream = self.pyaudio_instance.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.config.audio.sample_rate,
-                input=True,
-                input_device_index=self.device_index,
-                frames_per_buffer=self.config.audio.chunk_size,
-                start=False
-            )
-            test_stream.close()
-            
-            logger.info(f"Device access verified: {device_info['name']}")
+
+            # The format query hits the audio driver (the slowest step of
+            # initialization), so it is opt-in: the fast path stops at the
+            # cached maxInputChannels check and start_recording re-raises
+            # any real format problem when the stream actually opens.
+            if probe and not self.pyaudio_instance.is_format_supported(
+                self._sample_rate,
+                input_device=self.device_index,
+                input_channels=self._channels,
+                input_format=pyaudio.paInt16
+            ):
+                raise MicrophoneError(
+                    f"Device '{device_info['name']}' does not support the configured format",
+                    error_code="DEVICE_FORMAT_UNSUPPORTED",
+                    device_info=device_info
+                )
+
+            logger.info("Device access verified: %s", device_info['name'])
             
         except Exception as e:
-            logger.error(f"Device access verification failed: {e}")
+            logger.error("Device access verification failed: %s", e)
             raise MicrophoneError(
                 f"Cannot access microphone device: {str(e)}",
                 error_code="DEVICE_ACCESS_DENIED",
@@ -210,25 +423,39 @@ class AudioRecorder:
         
         if self.device_index is None:
             raise AudioError("No device selected")
-        
-        return self.pyaudio_instance.get_device_info_by_index(self.device_index)
+
+        return self._device_info_cache[self.device_index]
     
     def cleanup(self) -> None:
         """Clean up PyAudio resources."""
         try:
-            if self.stream and not self.stream.is_stopped():
-                self.stream.stop_stream()
+            if self.stream:
+                if not self.stream.is_stopped():
+                    self.stream.stop_stream()
                 self.stream.close()
                 self.stream = None
-            
-            if self.pyaudio_instance:
-                self.pyaudio_instance.terminate()
-                self.pyaudio_instance = None
-            
+
+            # Shut the persistent saver thread down for good
+            if self._consumer_thread and self._consumer_thread.is_alive():
+                self._q.put(None)
+                self._consumer_thread.join(timeout=5.0)
+            self._consumer_thread = None
+
+            if self._wav is not None:
+                self._wav.close()
+                self._wav = None
+            if self._raw is not None:
+                self._raw.close()
+                self._raw = None
+
+            if self._finalizer is not None:
+                self._finalizer()  # idempotent
+            self.pyaudio_instance = None
+
             logger.info("AudioRecorder cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """Context manager entry."""
@@ -279,31 +506,61 @@ class AudioRecorder:
                 start_time=time.time(),
                 file_path=str(output_path)
             )
-            self.audio_frames = []
-            self._stop_event.clear()
-            
-            # Create audio stream
-            self.stream = self.pyaudio_instance.open(
-                format=pyaudio.paInt16,
-                channels=self.config.audio.channels,
-                rate=self.config.audio.sample_rate,
-                input=True,
-                input_device_index=self.device_index,
-                frames_per_buffer=self.config.audio.chunk_size,
-                start=False
-            )
-            
-            # Start recording thread
-            self.recording_thread = threading.Thread(
-                target=self._recording_worker,
-                daemon=True
-            )
-            self.recording_thread.start()
-            
-            # Start the stream
-            self.stream.start_stream()
-            
-            logger.info(f"Recording started: {output_file}")
+            self._write_idx = 0
+            self._enqueued = 0
+            self._stop_requested = False
+
+            # Pick the per-chunk consumer once for this recording: a no-op
+            # when no listener is registered, batched delivery otherwise.
+            if self.on_audio_data is not None:
+                self._consume = self._consume_with_cb
+                self._cb_batch.clear()
+            else:
+                self._consume = self._consume_noop
+
+            # Open the WAV file up front and stream frames into it as they
+            # arrive: memory stays O(1) past the capture buffer and stop
+            # latency is just the file close (wave patches the length
+            # fields at close, so an interrupted recording still gets a
+            # valid header). The underlying file gets a 1 MiB buffer so
+            # chunk-sized writes coalesce into far fewer write() syscalls
+            # than the default 8 KiB stdio buffer allows.
+            self._raw = open(output_path, 'wb', buffering=1 << 20)
+            self._wav = wave.open(self._raw, 'wb')
+            self._wav.setnchannels(self._channels)
+            self._wav.setsampwidth(_SAMPLE_WIDTH_INT16)
+            self._wav.setframerate(self._sample_rate)
+
+            # The saver thread persists across recordings; spawn it only
+            # on the first recording (or if it died on a fatal error)
+            if self._consumer_thread is None or not self._consumer_thread.is_alive():
+                self._consumer_thread = threading.Thread(
+                    target=self._consumer_worker,
+                    daemon=True
+                )
+                self._consumer_thread.start()
+
+            if self.stream is not None and self.reuse_stream:
+                # Restarting the stopped stream skips the driver
+                # open round-trip entirely
+                self.stream.start_stream()
+            else:
+                if self.stream is not None:
+                    self.stream.close()
+                # Open in callback mode: PortAudio's native audio thread
+                # delivers frames to _pa_callback, so there is no Python
+                # read loop burning GIL between chunks.
+                self.stream = self.pyaudio_instance.open(
+                    format=pyaudio.paInt16,
+                    channels=self._channels,
+                    rate=self._sample_rate,
+                    input=True,
+                    input_device_index=self.device_index,
+                    frames_per_buffer=self._pa_buffer,
+                    stream_callback=self._pa_callback
+                )
+
+            logger.info("Recording started: %s", output_file)
             
             # Trigger callback
             if self.on_recording_started:
@@ -314,7 +571,7 @@ class AudioRecorder:
         except Exception as e:
             # Reset state on error
             self.state.is_recording = False
-            logger.error(f"Failed to start recording: {e}")
+            logger.error("Failed to start recording: %s", e)
             
             if isinstance(e, (AudioError, MicrophoneError, FileError)):
                 raise
@@ -338,63 +595,102 @@ class AudioRecorder:
         filename = f"recording_{timestamp}.wav"
         return str(temp_dir / filename)
     
-    def _recording_worker(self) -> None:
+    def _pa_callback(self, in_data, frame_count, time_info, status):
         """
-        Worker thread for continuous audio recording.
-        
-        This method runs in a separate thread and continuously reads
-        audio data from the microphone stream.
+        PortAudio stream callback invoked from the native audio thread.
+
+        PortAudio reserves callbacks for realtime work, so this only
+        enqueues the chunk for the saver thread and returns; the buffer
+        copy, file write and listener dispatch all happen off-callback.
+        """
+        try:
+            if self._stop_requested:
+                return (None, pyaudio.paComplete)
+
+            # The capture buffer is sized for exactly max_duration, so
+            # this single int compare doubles as the max-duration limit —
+            # no per-callback time.time() syscall or float math. The
+            # limit is quantized to the PortAudio buffer boundary, i.e.
+            # always within one buffer of the configured duration.
+            end = self._enqueued + frame_count * self._channels
+            if end > self._capacity:
+                logger.warning("Maximum recording duration reached: %ss", self._max_duration)
+                return (None, pyaudio.paComplete)
+            self._enqueued = end
+
+            self._q.put_nowait(in_data)
+            return (None, pyaudio.paContinue)
+
+        except Exception as e:
+            logger.error("Error in audio callback: %s", e)
+            if self.on_recording_error:
+                self.on_recording_error(e)
+            return (None, pyaudio.paAbort)
+
+    def _consumer_worker(self) -> None:
+        """
+        Saver thread that drains the callback queue.
+
+        Copies each chunk into the preallocated capture buffer, streams
+        it to the WAV file and dispatches it to the selected consumer.
+        Persists across recordings: _REC_DONE signals that one
+        recording's chunks are flushed, None shuts the thread down.
         """
         try:
-            logger.debug("Recording worker thread started")
-            
-            while not self._stop_event.is_set() and self.state.is_recording:
-                try:
-                    # Check for maximum duration
-                    if self.state.start_time:
-                        elapsed = time.time() - self.state.start_time
-                        if elapsed >= self.config.audio.max_duration:
-                            logger.warning(f"Maximum recording duration reached: {self.config.audio.max_duration}s")
-                            break
-                    
-                    # Read audio data
-                    if self.stream and self.stream.is_active():
-                        try:
-                            data = self.stream.read(
-                                self.config.audio.chunk_size,
-                                exception_on_overflow=False
-                            )
-                            
-                            if data:
-                                self.audio_frames.append(data)
-                                self.state.frames_recorded += 1
-                                
-                                # Update duration
-                                if self.state.start_time:
-                                    self.state.duration = time.time() - self.state.start_time
-                                
-                                # Trigger data callback
-                                if self.on_audio_data:
-                                    self.on_audio_data(data)
-                                    
-                        except Exception as e:
-                            if not self._stop_event.is_set():
-                                logger.error(f"Error reading audio data: {e}")
-                                break
-                    else:
-                        break
-                        
-                except Exception as e:
-                    logger.error(f"Error in recording worker: {e}")
+            logger.debug("Audio consumer thread started")
+            _set_realtime_priority()
+            get = self._q.get
+
+            while True:
+                in_data = get()
+                if in_data is None:
                     break
-            
-            logger.debug("Recording worker thread finished")
-            
+                if in_data is _REC_DONE:
+                    self._drained.set()
+                    continue
+
+                frame = np.frombuffer(in_data, dtype=np.int16)
+                end = self._write_idx + frame.size
+                if end > self._capacity:
+                    frame = frame[:self._capacity - self._write_idx]
+                    end = self._capacity
+                self._pcm[self._write_idx:end] = frame
+                self._write_idx = end
+                self.state.frames_recorded += 1
+
+                # Stream to disk incrementally. writeframesraw skips the
+                # header patch writeframes performs per call (two lseeks
+                # back to the length fields); close() patches the header
+                # once from the final write position instead.
+                if self._wav is not None:
+                    self._wav.writeframesraw(in_data)
+
+                # Hand the chunk to the consumer selected at start time
+                self._consume(in_data)
+
+            logger.debug("Audio consumer thread finished")
+
         except Exception as e:
-            logger.error(f"Fatal error in recording worker: {e}")
+            logger.error("Fatal error in audio consumer thread: %s", e)
             if self.on_recording_error:
                 self.on_recording_error(e)
-    
+
+    def _consume_noop(self, in_data: bytes) -> None:
+        """Per-chunk consumer used when no on_audio_data listener is set."""
+
+    def _consume_with_cb(self, in_data: bytes) -> None:
+        """
+        Per-chunk consumer that delivers audio to on_audio_data in batches.
+
+        Chunks are accumulated until roughly _CB_BATCH_CHUNKS worth have
+        arrived, so the listener sees fewer, larger calls. Callback latency
+        is therefore batch-sized rather than chunk-sized.
+        """
+        self._cb_batch += in_data
+        if len(self._cb_batch) >= self._cb_batch_target:
+            self.on_audio_data(bytes(self._cb_batch))
+            self._cb_batch.clear()
+
     def stop_recording(self, save_file: bool = True) -> Optional[str]:
         """
         Stop audio recording and optionally save to file.
@@ -418,32 +714,49 @@ class AudioRecorder:
         try:
             logger.info("Stopping recording...")
             
-            # Signal the recording thread to stop
-            self._stop_event.set()
+            # Signal the callback to complete, then tear down the stream
+            self._stop_requested = True
             self.state.is_recording = False
-            
-            # Stop and close the audio stream
+
+            # Stop the audio stream; keep it open for the next recording
+            # when reuse is enabled (closing costs a driver round-trip on
+            # the next start)
             if self.stream:
-                if self.stream.is_active():
+                # A stream whose callback returned paComplete is already
+                # inactive but not stopped; it must still be stopped here
+                # or the next start_stream() under reuse is rejected with
+                # paStreamIsNotStopped.
+                if not self.stream.is_stopped():
                     self.stream.stop_stream()
-                self.stream.close()
-                self.stream = None
-            
-            # Wait for recording thread to finish
-            if self.recording_thread and self.recording_thread.is_alive():
-                self.recording_thread.join(timeout=5.0)
-                if self.recording_thread.is_alive():
-                    logger.warning("Recording thread did not finish within timeout")
-            
+                if not self.reuse_stream:
+                    self.stream.close()
+                    self.stream = None
+
+            # Drain the saver thread: the end-of-recording sentinel is
+            # behind any chunks still queued, so waiting for it
+            # guarantees they reached the file. The thread itself stays
+            # up for the next recording.
+            self._drained.clear()
+            self._q.put(_REC_DONE)
+            if not self._drained.wait(timeout=5.0):
+                logger.warning("Audio consumer thread did not drain within timeout")
+
+            # Flush any partially filled callback batch
+            if self._cb_batch and self.on_audio_data:
+                self.on_audio_data(bytes(self._cb_batch))
+                self._cb_batch.clear()
+
             # Update final duration
             if self.state.start_time:
                 self.state.duration = time.time() - self.state.start_time
             
             saved_file = None
-            if save_file and self.audio_frames:
+            if save_file and self._write_idx > 0:
                 saved_file = self._save_recording()
+            else:
+                self._discard_recording()
             
-            logger.info(f"Recording stopped. Duration: {self.state.duration:.2f}s, Frames: {self.state.frames_recorded}")
+            logger.info("Recording stopped. Duration: %.2fs, Frames: %s", self.state.duration, self.state.frames_recorded)
             
             # Trigger callback
             if self.on_recording_stopped:
@@ -452,7 +765,7 @@ class AudioRecorder:
             return saved_file
             
         except Exception as e:
-            logger.error(f"Error stopping recording: {e}")
+            logger.error("Error stopping recording: %s", e)
             if isinstance(e, (AudioError, FileError)):
                 raise
             
@@ -467,38 +780,42 @@ class AudioRecorder:
     
     def _save_recording(self) -> str:
         """
-        Save the recorded audio frames to a WAV file.
-        
+        Finalize the streamed WAV file.
+
+        Frames were written to disk as they arrived, so saving is just
+        closing the file (which patches the header length fields) and
+        verifying the result. Assumes start_recording has already created
+        the parent directory; no mkdir or directory stat happens here.
+
         Returns:
             Path to the saved file
-            
+
         Raises:
-            FileError: If file saving fails
+            FileError: If file finalization fails
         """
-        if not self.audio_frames:
+        if self._wav is None:
             raise FileError(
                 "No audio data to save",
                 error_code="NO_AUDIO_DATA"
             )
-        
+
         if not self.state.file_path:
             raise FileError(
                 "No output file path specified",
                 error_code="NO_OUTPUT_PATH"
             )
-        
+
         try:
-            # Ensure output directory exists
             output_path = Path(self.state.file_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save audio data as WAV file
-            with wave.open(str(output_path), 'wb') as wav_file:
-                wav_file.setnchannels(self.config.audio.channels)
-                wav_file.setsampwidth(self.pyaudio_instance.get_sample_size(pyaudio.paInt16))
-                wav_file.setframerate(self.config.audio.sample_rate)
-                wav_file.writeframes(b''.join(self.audio_frames))
-            
+
+            # Close the WAV wrapper first (patches the header), then the
+            # buffered file it was writing through.
+            self._wav.close()
+            self._wav = None
+            if self._raw is not None:
+                self._raw.close()
+                self._raw = None
+
             # Verify file was created and has content
             if not output_path.exists() or output_path.stat().st_size == 0:
                 raise FileError(
@@ -508,12 +825,12 @@ class AudioRecorder:
                 )
             
             file_size = output_path.stat().st_size
-            logger.info(f"Audio saved: {output_path} ({file_size} bytes)")
+            logger.info("Audio saved: %s (%s bytes)", output_path, file_size)
             
             return str(output_path)
             
         except Exception as e:
-            logger.error(f"Failed to save recording: {e}")
+            logger.error("Failed to save recording: %s", e)
             if isinstance(e, FileError):
                 raise
             
@@ -522,7 +839,29 @@ class AudioRecorder:
                 error_code="FILE_SAVE_FAILED",
                 file_path=self.state.file_path
             ) from e
-    
+
+    def _discard_recording(self) -> None:
+        """Close the streamed WAV file and remove it from disk."""
+        if self._wav is None:
+            return
+
+        try:
+            self._wav.close()
+            if self._raw is not None:
+                self._raw.close()
+        except Exception:
+            pass
+        finally:
+            self._wav = None
+            self._raw = None
+
+        if self.state.file_path:
+            try:
+                Path(self.state.file_path).unlink(missing_ok=True)
+                logger.debug("Discarded recording file: %s", self.state.file_path)
+            except OSError as e:
+                logger.warning("Could not remove discarded recording: %s", e)
+
     def pause_recording(self) -> None:
         """
         Pause the current recording.
@@ -550,7 +889,7 @@ class AudioRecorder:
             logger.info("Recording paused")
             
         except Exception as e:
-            logger.error(f"Failed to pause recording: {e}")
+            logger.error("Failed to pause recording: %s", e)
             raise AudioError(
                 f"Failed to pause recording: {str(e)}",
                 error_code="RECORDING_PAUSE_FAILED"
@@ -583,12 +922,51 @@ class AudioRecorder:
             logger.info("Recording resumed")
             
         except Exception as e:
-            logger.error(f"Failed to resume recording: {e}")
+            logger.error("Failed to resume recording: %s", e)
             raise AudioError(
                 f"Failed to resume recording: {str(e)}",
                 error_code="RECORDING_RESUME_FAILED"
             ) from e
     
+    def get_numpy_view(self) -> np.ndarray:
+        """
+        Get the captured samples as a typed int16 view, without copying.
+
+        Lets downstream consumers (VAD, RMS metering, resampling,
+        transcription) run vectorized NumPy operations directly on the
+        capture buffer.
+
+        Returns:
+            int16 ndarray view over the recorded samples
+        """
+        return self._pcm[:self._write_idx]
+
+    def frames_bytes(self) -> memoryview:
+        """
+        Get the captured PCM samples as a zero-copy bytes-like view.
+
+        Suitable for wave.writeframes or any consumer of the buffer
+        protocol; no intermediate bytes object is created.
+
+        Returns:
+            memoryview over the recorded int16 samples
+        """
+        return memoryview(self._pcm[:self._write_idx]).cast('B')
+
+    def get_normalized_audio(self) -> np.ndarray:
+        """
+        Get the captured audio as normalized float32 samples.
+
+        Converts the int16 capture buffer in place into the preallocated
+        float32 buffer (the format Whisper preprocessing expects).
+
+        Returns:
+            float32 view of the captured samples, scaled to [-1.0, 1.0)
+        """
+        n = self._write_idx
+        int16_to_float32(self._pcm[:n], self._float_pcm)
+        return self._float_pcm[:n]
+
     def get_recording_info(self) -> dict:
         """
         Get information about the current recording state.
@@ -596,18 +974,19 @@ class AudioRecorder:
         Returns:
             Dictionary containing recording information
         """
+        # Duration is finalized at stop time; report it live while recording
+        duration = self.state.duration
+        if self.state.is_recording and self.state.start_time:
+            duration = time.time() - self.state.start_time
+
         return {
             'is_recording': self.state.is_recording,
             'is_paused': self.state.is_paused,
-            'duration': self.state.duration,
+            'duration': duration,
             'frames_recorded': self.state.frames_recorded,
             'file_path': self.state.file_path,
             'start_time': self.state.start_time
         }
-    
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.cleanup()
 
 
 # Utility function for checking PyAudio availability
@@ -618,7 +997,7 @@ def is_pyaudio_available() -> bool:
     Returns:
         True if PyAudio is available, False otherwise
     """
-    return PYAUDIO_AVAILABLE
+    return _ensure_pyaudio()
 
 
 def get_audio_recorder(device_index: Optional[int] = None) -> AudioRecorder:
@@ -634,10 +1013,13 @@ def get_audio_recorder(device_index: Optional[int] = None) -> AudioRecorder:
     Raises:
         AudioError: If PyAudio is not available
     """
-    if not PYAUDIO_AVAILABLE:
-        raise AudioError(
-            ErrorMessages.MICROPHONE_NOT_AVAILABLE,
-            error_code="PYAUDIO_NOT_AVAILABLE"
-        )
-    
+    # Prefer the lock-free rtmixer backend when configured and installed
+    if get_config().audio.use_rtmixer:
+        from .recorder_rtmixer import RTMIXER_AVAILABLE, RtMixerRecorder
+        if RTMIXER_AVAILABLE:
+            return RtMixerRecorder(device_index=device_index)
+        logger.warning("use_rtmixer is set but rtmixer is not installed, falling back to PyAudio")
+
+    # AudioRecorder.__init__ already raises AudioError when PyAudio is
+    # missing; no need to check twice.
     return AudioRecorder(device_index=device_index)
@@ -0,0 +1,437 @@
+"""
+Low-Latency Audio Recording Module (rtmixer backend)
+
+Alternative capture path that keeps the PortAudio callback entirely in C.
+Instead of pumping every chunk through a Python callback (which holds the
+GIL and is exposed to GC pauses), rtmixer writes PCM straight into a
+lock-free ring buffer and a Python consumer thread drains it at its own
+pace into a preallocated numpy buffer.
+"""
+
+import wave
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Callable
+
+import numpy as np
+
+# rtmixer import with fallback for development
+try:
+    import rtmixer
+    RTMIXER_AVAILABLE = True
+except ImportError:
+    rtmixer = None
+    RTMIXER_AVAILABLE = False
+
+from ..utils.logging_config import get_logger
+from ..utils.config import get_config
+from ..utils.exceptions import AudioError, MicrophoneError, FileError
+from .recorder import RecordingState, _set_realtime_priority
+
+logger = get_logger(__name__)
+
+# How many chunks the ring buffer can hold before the C side overwrites
+# unread data. Sized generously so GC pauses on the consumer side never
+# cause drops at typical chunk sizes.
+RING_BUFFER_CHUNKS = 64
+
+
+def next_power_of_two(n: int) -> int:
+    """Round n up to the next power of two (ring buffer size requirement)."""
+    return 1 << (n - 1).bit_length()
+
+
+class RtMixerRecorder:
+    """
+    Handles audio recording from microphone using rtmixer.
+
+    Mirrors AudioRecorder's public API so callers can switch backends via
+    configuration. The PortAudio callback runs in C and never acquires the
+    GIL; Python only drains the ring buffer from a consumer thread.
+    """
+
+    def __init__(self, device_index: Optional[int] = None):
+        """
+        Initialize the RtMixerRecorder.
+
+        Args:
+            device_index: Optional specific audio device index to use
+
+        Raises:
+            AudioError: If rtmixer is not available
+        """
+        if not RTMIXER_AVAILABLE:
+            raise AudioError(
+                "rtmixer is not available. Please install rtmixer for low-latency recording.",
+                error_code="RTMIXER_NOT_AVAILABLE"
+            )
+
+        self.config = get_config()
+        self.device_index = device_index
+        self.recorder: Optional["rtmixer.Recorder"] = None
+        self.ring_buffer: Optional["rtmixer.RingBuffer"] = None
+        self.consumer_thread: Optional[threading.Thread] = None
+        self.state = RecordingState()
+        self._record_action = None
+        self._stop_event = threading.Event()
+
+        # Bind the hot config values once; the drain loop reads them many
+        # times per second and each dotted chain is three dict probes.
+        audio = self.config.audio
+        self._sample_rate = audio.sample_rate
+        self._channels = audio.channels
+        self._chunk_size = audio.chunk_size
+
+        # Preallocate the capture buffer once; the consumer thread appends
+        # into it with a write cursor, so there are no per-chunk allocations.
+        self._capacity = audio.max_duration * audio.sample_rate * audio.channels
+        self._pcm = np.empty(self._capacity, dtype=np.int16)
+        self._write_idx = 0
+
+        # Callbacks (invoked from the consumer thread, not the audio callback)
+        self.on_recording_started: Optional[Callable] = None
+        self.on_recording_stopped: Optional[Callable] = None
+        self.on_recording_error: Optional[Callable] = None
+
+        logger.info("RtMixerRecorder initialized")
+
+    def initialize_pyaudio(self) -> None:
+        """
+        Initialize the rtmixer stream and ring buffer.
+
+        Named for API parity with AudioRecorder.initialize_pyaudio so the
+        two backends are interchangeable.
+
+        Raises:
+            MicrophoneError: If stream initialization fails
+        """
+        try:
+            if self.recorder is None:
+                self.recorder = rtmixer.Recorder(
+                    device=self.device_index,
+                    channels=self._channels,
+                    blocksize=self._chunk_size,
+                    samplerate=self._sample_rate
+                )
+                # One ring buffer, allocated once at init (no per-frame
+                # allocations). itemsize is one int16 frame across channels.
+                self.ring_buffer = rtmixer.RingBuffer(
+                    elementsize=self._channels * 2,
+                    size=next_power_of_two(self._chunk_size * RING_BUFFER_CHUNKS)
+                )
+                logger.info("rtmixer recorder and ring buffer created")
+
+        except Exception as e:
+            logger.error("Failed to initialize rtmixer: %s", e)
+            if isinstance(e, AudioError):
+                raise
+            raise MicrophoneError(
+                f"Failed to initialize microphone: {str(e)}",
+                error_code="MICROPHONE_INIT_FAILED"
+            ) from e
+
+    def start_recording(self, output_file: Optional[str] = None) -> str:
+        """
+        Start audio recording into the ring buffer.
+
+        Args:
+            output_file: Optional path for output file. If None, generates temp file.
+
+        Returns:
+            Path to the recording file
+
+        Raises:
+            AudioError: If recording is already in progress
+            MicrophoneError: If microphone access fails
+        """
+        if self.state.is_recording:
+            raise AudioError(
+                "Recording is already in progress",
+                error_code="RECORDING_IN_PROGRESS"
+            )
+
+        try:
+            if self.recorder is None:
+                self.initialize_pyaudio()
+
+            if output_file is None:
+                output_file = self._generate_temp_filename()
+
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self.state = RecordingState(
+                is_recording=True,
+                start_time=time.time(),
+                file_path=str(output_path)
+            )
+            self._write_idx = 0
+            self._stop_event.clear()
+
+            # Submit the record action once; the C callback streams into
+            # the ring buffer from here on without touching Python.
+            self.recorder.start()
+            self._record_action = self.recorder.record_ringbuffer(self.ring_buffer)
+
+            self.consumer_thread = threading.Thread(
+                target=self._drain_worker,
+                daemon=True
+            )
+            self.consumer_thread.start()
+
+            logger.info("Recording started (rtmixer): %s", output_file)
+
+            if self.on_recording_started:
+                self.on_recording_started(output_file)
+
+            return str(output_path)
+
+        except Exception as e:
+            self.state.is_recording = False
+            logger.error("Failed to start recording: %s", e)
+
+            if isinstance(e, (AudioError, MicrophoneError, FileError)):
+                raise
+
+            raise MicrophoneError(
+                f"Failed to start recording: {str(e)}",
+                error_code="RECORDING_START_FAILED"
+            ) from e
+
+    def _generate_temp_filename(self) -> str:
+        """
+        Generate a temporary filename for recording.
+
+        Returns:
+            Path to temporary recording file
+        """
+        from ..utils.config import config_manager
+
+        temp_dir = config_manager.create_temp_dir()
+        timestamp = int(time.time())
+        filename = f"recording_{timestamp}.wav"
+        return str(temp_dir / filename)
+
+    def _drain_worker(self) -> None:
+        """
+        Consumer thread that drains the ring buffer into the capture buffer.
+
+        Runs until stopped or the capture buffer is full. The ring buffer
+        hand-off means this thread can be paused by GC without disturbing
+        the C audio callback.
+        """
+        try:
+            logger.debug("Ring buffer drain thread started")
+            _set_realtime_priority()
+            channels = self._channels
+
+            # Event.wait doubles as stop signal and pacing: it blocks
+            # cleanly between drains and returns immediately once
+            # stop_recording sets the event. The ring buffer holds many
+            # chunks, so a 10 ms cadence never risks overwrites.
+            while not self._stop_event.wait(0.01):
+                if not self.state.is_recording:
+                    break
+                self._drain_available(channels)
+
+            # Final drain so no frames buffered at stop time are lost
+            self._drain_available(channels)
+
+            logger.debug("Ring buffer drain thread finished")
+
+        except Exception as e:
+            logger.error("Fatal error in drain worker: %s", e)
+            if self.on_recording_error:
+                self.on_recording_error(e)
+
+    def _drain_available(self, channels: int) -> None:
+        """Copy all currently readable ring buffer frames into the capture buffer."""
+        frames = self.ring_buffer.read_available
+        if frames <= 0:
+            return
+
+        # get_read_buffers exposes up to two memoryviews (the ring may
+        # wrap); copy both, then advance the read index so the C side
+        # can reuse the space.
+        drained = 0
+        for chunk in self.ring_buffer.get_read_buffers(frames):
+            data = np.frombuffer(chunk, dtype=np.int16)
+            end = self._write_idx + data.size
+            if end > self._capacity:
+                logger.warning("Capture buffer full, truncating recording")
+                data = data[:self._capacity - self._write_idx]
+                end = self._capacity
+            self._pcm[self._write_idx:end] = data
+            self._write_idx = end
+            drained += data.size
+        self.ring_buffer.advance_read_index(frames)
+        self.state.frames_recorded += drained // (self._chunk_size * channels)
+
+        if self.state.start_time:
+            self.state.duration = time.time() - self.state.start_time
+
+    def stop_recording(self, save_file: bool = True) -> Optional[str]:
+        """
+        Stop audio recording and optionally save to file.
+
+        Args:
+            save_file: Whether to save the recorded audio to file
+
+        Returns:
+            Path to saved file if save_file=True, None otherwise
+
+        Raises:
+            AudioError: If no recording is in progress
+            FileError: If file saving fails
+        """
+        if not self.state.is_recording:
+            raise AudioError(
+                "No recording in progress",
+                error_code="NO_RECORDING_IN_PROGRESS"
+            )
+
+        try:
+            logger.info("Stopping recording (rtmixer)...")
+
+            if self._record_action is not None:
+                self.recorder.cancel(self._record_action)
+                self._record_action = None
+            self.recorder.stop()
+
+            self.state.is_recording = False
+            self._stop_event.set()
+
+            if self.consumer_thread and self.consumer_thread.is_alive():
+                self.consumer_thread.join(timeout=5.0)
+                if self.consumer_thread.is_alive():
+                    logger.warning("Drain thread did not finish within timeout")
+
+            if self.state.start_time:
+                self.state.duration = time.time() - self.state.start_time
+
+            saved_file = None
+            if save_file and self._write_idx > 0:
+                saved_file = self._save_recording()
+
+            logger.info("Recording stopped. Duration: %.2fs", self.state.duration)
+
+            if self.on_recording_stopped:
+                self.on_recording_stopped(saved_file, self.state.duration)
+
+            return saved_file
+
+        except Exception as e:
+            logger.error("Error stopping recording: %s", e)
+            if isinstance(e, (AudioError, FileError)):
+                raise
+
+            raise AudioError(
+                f"Failed to stop recording: {str(e)}",
+                error_code="RECORDING_STOP_FAILED"
+            ) from e
+
+        finally:
+            self.state.is_recording = False
+
+    def _save_recording(self) -> str:
+        """
+        Save the captured PCM buffer to a WAV file.
+
+        Returns:
+            Path to the saved file
+
+        Raises:
+            FileError: If file saving fails
+        """
+        if self._write_idx == 0:
+            raise FileError(
+                "No audio data to save",
+                error_code="NO_AUDIO_DATA"
+            )
+
+        if not self.state.file_path:
+            raise FileError(
+                "No output file path specified",
+                error_code="NO_OUTPUT_PATH"
+            )
+
+        try:
+            output_path = Path(self.state.file_path)
+
+            with wave.open(str(output_path), 'wb') as wav_file:
+                wav_file.setnchannels(self._channels)
+                wav_file.setsampwidth(2)  # int16
+                wav_file.setframerate(self._sample_rate)
+                wav_file.writeframes(self._pcm[:self._write_idx].tobytes())
+
+            if not output_path.exists() or output_path.stat().st_size == 0:
+                raise FileError(
+                    f"Failed to create audio file: {output_path}",
+                    error_code="FILE_CREATION_FAILED",
+                    file_path=str(output_path)
+                )
+
+            file_size = output_path.stat().st_size
+            logger.info("Audio saved: %s (%s bytes)", output_path, file_size)
+
+            return str(output_path)
+
+        except Exception as e:
+            logger.error("Failed to save recording: %s", e)
+            if isinstance(e, FileError):
+                raise
+
+            raise FileError(
+                f"Failed to save recording to {self.state.file_path}: {str(e)}",
+                error_code="FILE_SAVE_FAILED",
+                file_path=self.state.file_path
+            ) from e
+
+    def get_recording_info(self) -> dict:
+        """
+        Get information about the current recording state.
+
+        Returns:
+            Dictionary containing recording information
+        """
+        return {
+            'is_recording': self.state.is_recording,
+            'is_paused': self.state.is_paused,
+            'duration': self.state.duration,
+            'frames_recorded': self.state.frames_recorded,
+            'file_path': self.state.file_path,
+            'start_time': self.state.start_time
+        }
+
+    def cleanup(self) -> None:
+        """Clean up rtmixer resources."""
+        try:
+            if self.recorder is not None:
+                self.recorder.close()
+                self.recorder = None
+            self.ring_buffer = None
+
+            logger.info("RtMixerRecorder cleanup completed")
+
+        except Exception as e:
+            logger.error("Error during cleanup: %s", e)
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.initialize_pyaudio()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.cleanup()
+
+
+def is_rtmixer_available() -> bool:
+    """
+    Check if rtmixer is available for use.
+
+    Returns:
+        True if rtmixer is available, False otherwise
+    """
+    return RTMIXER_AVAILABLE
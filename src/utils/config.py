@@ -5,6 +5,8 @@ Handles application settings, environment variables, and configuration loading.
 """
 
 import os
+import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -18,8 +20,89 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Capturing variant of RegexPatterns.WINDOW_SIZE_PATTERN, compiled once
+# at import. Matching instead of split-and-catch means malformed input
+# returns None rather than paying exception setup/teardown.
+_WIN_RE = re.compile(r'^(\d+)x(\d+)$')
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _load_dotenv_once(path_str: str) -> bool:
+    """
+    Parse a .env file into the environment, once per resolved path.
+
+    dotenv re-parses the file on every call; caching on the path means
+    repeated load_config/get_config chains only pay for parsing once.
+    reload_config clears this cache to pick up on-disk edits.
+    """
+    load_dotenv(path_str)
+    return True
+
+
+def _to_bool(value: str) -> bool:
+    """Convert an environment string like 'True' to a bool."""
+    return value.lower() == "true"
+
+
+def _parse_window_size(size_str: str) -> tuple:
+    """Parse window size string like '600x400' into tuple."""
+    match = _WIN_RE.match(size_str) if isinstance(size_str, str) else None
+    if match:
+        return (int(match.group(1)), int(match.group(2)))
+    logger.warning("Invalid window size format: %s, using default", size_str)
+    return (600, 400)
+
+
+# Declarative (field, env var, converter, default) schemas: one loop per
+# section replaces a block of repetitive getenv/convert calls, and the
+# tables are allocated once at import.
+_AUDIO_SCHEMA = (
+    ("sample_rate", "SAMPLE_RATE", int, 16000),
+    ("channels", "CHANNELS", int, 1),
+    ("chunk_size", "CHUNK_SIZE", int, 1024),
+    ("format", "AUDIO_FORMAT", str, "wav"),
+    ("max_duration", "MAX_DURATION", int, 300),
+    ("use_rtmixer", "USE_RTMIXER", _to_bool, False),
+)
+
+_API_SCHEMA = (
+    ("openai_api_key", "OPENAI_API_KEY", str, ""),
+    ("whisper_model", "WHISPER_MODEL", str, "whisper-1"),
+    ("gpt_model", "GPT_MODEL", str, "gpt-3.5-turbo"),
+    ("max_retries", "MAX_RETRIES", int, 3),
+    ("timeout", "TIMEOUT", int, 30),
+    ("rate_limit_delay", "RATE_LIMIT_DELAY", float, 1.0),
+)
+
+_APP_SCHEMA = (
+    ("debug", "DEBUG", _to_bool, False),
+    ("log_level", "LOG_LEVEL", str, "INFO"),
+    ("temp_dir", "TEMP_DIR", str, "./temp"),
+    ("window_title", "WINDOW_TITLE", str, "V2T - Voice to Text"),
+    ("window_size", "WINDOW_SIZE", _parse_window_size, (600, 400)),
+    ("theme", "THEME", str, "default"),
+)
+
+
+def _from_env(cls, schema, env: Dict[str, str]):
+    """
+    Build a config section from an environment snapshot using its schema.
+
+    Args:
+        cls: Config dataclass to construct
+        schema: (field, env var, converter, default) tuples
+        env: Plain-dict snapshot of the environment
+
+    Returns:
+        Constructed config instance
+    """
+    return cls(**{
+        field_name: conv(env[key]) if key in env else default
+        for field_name, key, conv, default in schema
+    })
+
+
+@dataclass(slots=True, frozen=True)
 class AudioConfig:
     """Audio processing configuration."""
     sample_rate: int = 16000
@@ -27,9 +110,10 @@ class AudioConfig:
     chunk_size: int = 1024
     format: str = "wav"
     max_duration: int = 300  # 5 minutes max
+    use_rtmixer: bool = False  # Use the lock-free rtmixer capture backend
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class APIConfig:
     """API configuration for OpenAI services."""
     openai_api_key: str = ""
@@ -40,7 +124,7 @@ class APIConfig:
     rate_limit_delay: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Application configuration."""
     debug: bool = False
@@ -51,30 +135,47 @@ class AppConfig:
     theme: str = "default"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration class containing all settings."""
-    audio: AudioConfig = field(default_factory=AudioConfig)
-    api: APIConfig = field(default_factory=APIConfig)
-    app: AppConfig = field(default_factory=AppConfig)
-    
+    audio: Optional[AudioConfig] = None
+    api: Optional[APIConfig] = None
+    app: Optional[AppConfig] = None
+
+    # Validation as a precompiled (predicate, message) table, built once
+    # at class creation and iterated in one tight loop per instance.
+    _VALIDATORS = (
+        (lambda c: c.audio.sample_rate > 0,
+         "Sample rate must be positive"),
+        (lambda c: c.audio.channels in (1, 2),
+         "Channels must be 1 (mono) or 2 (stereo)"),
+        (lambda c: c.api.max_retries >= 0,
+         "Max retries cannot be negative"),
+    )
+
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """Fill in defaults and validate configuration."""
+        # Defaults are built only when the caller did not supply a
+        # section, instead of default_factory allocating all three
+        # up front and discarding the ones that get replaced. frozen
+        # blocks normal assignment, so defaults go through
+        # object.__setattr__ (the documented escape hatch).
+        if self.audio is None:
+            object.__setattr__(self, 'audio', AudioConfig())
+        if self.api is None:
+            object.__setattr__(self, 'api', APIConfig())
+        if self.app is None:
+            object.__setattr__(self, 'app', AppConfig())
         self._validate_config()
-    
+
     def _validate_config(self) -> None:
         """Validate configuration values."""
         if not self.api.openai_api_key:
             logger.warning("OpenAI API key not configured")
-        
-        if self.audio.sample_rate <= 0:
-            raise ValueError("Sample rate must be positive")
-        
-        if self.audio.channels not in [1, 2]:
-            raise ValueError("Channels must be 1 (mono) or 2 (stereo)")
-        
-        if self.api.max_retries < 0:
-            raise ValueError("Max retries cannot be negative")
+
+        for check, message in self._VALIDATORS:
+            if not check(self):
+                raise ValueError(message)
 
 
 class ConfigManager:
@@ -83,7 +184,11 @@ class ConfigManager:
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self._config: Optional[Config] = None
-        
+        # Joined env-file paths, keyed by file name. Path.__truediv__
+        # re-normalizes and allocates a fresh Path on every call, so the
+        # join is done once per distinct env file.
+        self._env_path_cache: Dict[str, Path] = {}
+
     def load_config(self, env_file: str = ".env") -> Config:
         """
         Load configuration from environment variables and .env file.
@@ -94,41 +199,29 @@ class ConfigManager:
         Returns:
             Loaded configuration
         """
-        env_path = self.config_dir / env_file
-        
-        # Load .env file if it exists and dotenv is available
-        if load_dotenv and env_path.exists():
-            load_dotenv(env_path)
-            logger.info(f"Loaded environment from {env_path}")
-        elif env_path.exists():
+        env_path = self._env_path_cache.get(env_file)
+        if env_path is None:
+            env_path = self._env_path_cache[env_file] = self.config_dir / env_file
+
+        # Load .env file if it exists and dotenv is available. One
+        # is_file() check (a single stat) feeds both branches instead of
+        # each branch paying its own syscall.
+        env_file_present = env_path.is_file()
+        if load_dotenv and env_file_present:
+            _load_dotenv_once(str(env_path.resolve()))
+            logger.info("Loaded environment from %s", env_path)
+        elif env_file_present:
             logger.warning("python-dotenv not installed, .env file ignored")
-        
+
+        # Snapshot the environment once: os.getenv goes through the
+        # _Environ proxy (encode/decode per lookup), while a plain dict
+        # get is a single hash probe for each of the ~18 reads below.
+        env = dict(os.environ)
+
         # Create configuration from environment variables
-        audio_config = AudioConfig(
-            sample_rate=int(os.getenv("SAMPLE_RATE", "16000")),
-            channels=int(os.getenv("CHANNELS", "1")),
-            chunk_size=int(os.getenv("CHUNK_SIZE", "1024")),
-            format=os.getenv("AUDIO_FORMAT", "wav"),
-            max_duration=int(os.getenv("MAX_DURATION", "300"))
-        )
-        
-        api_config = APIConfig(
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            whisper_model=os.getenv("WHISPER_MODEL", "whisper-1"),
-            gpt_model=os.getenv("GPT_MODEL", "gpt-3.5-turbo"),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            timeout=int(os.getenv("TIMEOUT", "30")),
-            rate_limit_delay=float(os.getenv("RATE_LIMIT_DELAY", "1.0"))
-        )
-        
-        app_config = AppConfig(
-            debug=os.getenv("DEBUG", "False").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            temp_dir=os.getenv("TEMP_DIR", "./temp"),
-            window_title=os.getenv("WINDOW_TITLE", "V2T - Voice to Text"),
-            window_size=self._parse_window_size(os.getenv("WINDOW_SIZE", "600x400")),
-            theme=os.getenv("THEME", "default")
-        )
+        audio_config = _from_env(AudioConfig, _AUDIO_SCHEMA, env)
+        api_config = _from_env(APIConfig, _API_SCHEMA, env)
+        app_config = _from_env(AppConfig, _APP_SCHEMA, env)
         
         self._config = Config(
             audio=audio_config,
@@ -152,12 +245,7 @@ class ConfigManager:
     
     def _parse_window_size(self, size_str: str) -> tuple:
         """Parse window size string like '600x400' into tuple."""
-        try:
-            width, height = size_str.split('x')
-            return (int(width), int(height))
-        except (ValueError, AttributeError):
-            logger.warning(f"Invalid window size format: {size_str}, using default")
-            return (600, 400)
+        return _parse_window_size(size_str)
     
     def create_temp_dir(self) -> Path:
         """Create temporary directory if it doesn't exist."""
@@ -166,15 +254,33 @@ class ConfigManager:
         return temp_path
 
 
-# Global configuration manager instance
-config_manager = ConfigManager()
+def _get_manager() -> ConfigManager:
+    """Create the global ConfigManager on first use and cache it."""
+    manager = globals().get("config_manager")
+    if manager is None:
+        manager = globals()["config_manager"] = ConfigManager()
+    return manager
+
+
+def __getattr__(name: str):
+    """
+    Lazily create the module-global config_manager (PEP 562).
+
+    Importers that never touch configuration no longer pay for the
+    instance at import time; `from .config import config_manager` still
+    works because the import machinery falls back to this hook.
+    """
+    if name == "config_manager":
+        return _get_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_config() -> Config:
     """Get the global configuration instance."""
-    return config_manager.get_config()
+    return _get_manager().get_config()
 
 
 def reload_config() -> Config:
-    """Reload configuration from files."""
-    return config_manager.load_config()
+    """Reload configuration from files, re-parsing any .env file."""
+    _load_dotenv_once.cache_clear()
+    return _get_manager().load_config()
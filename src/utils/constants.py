@@ -53,7 +53,7 @@ class AudioConstants:
     FORMAT_FLAC = "flac"
     
     DEFAULT_FORMAT = FORMAT_WAV
-    SUPPORTED_FORMATS = [FORMAT_WAV, FORMAT_MP3, FORMAT_M4A, FORMAT_FLAC]
+    SUPPORTED_FORMATS = (FORMAT_WAV, FORMAT_MP3, FORMAT_M4A, FORMAT_FLAC)
     
     # Channels
     MONO = 1
@@ -247,30 +247,36 @@ class KeyboardShortcuts:
     HELP = "<F1>"
 
 
-# File Extensions and Filters
+# File Extensions and Filters. Module-level tuples so callers can reach
+# them with one global load instead of a class attribute lookup.
+AUDIO_FILE_FILTERS = (
+    ("Audio Files", "*.wav *.mp3 *.m4a *.flac"),
+    ("WAV Files", "*.wav"),
+    ("MP3 Files", "*.mp3"),
+    ("M4A Files", "*.m4a"),
+    ("FLAC Files", "*.flac"),
+    ("All Files", "*.*")
+)
+
+TEXT_FILE_FILTERS = (
+    ("Text Files", "*.txt"),
+    ("All Files", "*.*")
+)
+
+CONFIG_FILE_FILTERS = (
+    ("Configuration Files", "*.json *.ini *.conf"),
+    ("JSON Files", "*.json"),
+    ("INI Files", "*.ini"),
+    ("All Files", "*.*")
+)
+
+
 class FileFilters:
-    """File dialog filters."""
-    
-    AUDIO_FILES = [
-        ("Audio Files", "*.wav *.mp3 *.m4a *.flac"),
-        ("WAV Files", "*.wav"),
-        ("MP3 Files", "*.mp3"),
-        ("M4A Files", "*.m4a"),
-        ("FLAC Files", "*.flac"),
-        ("All Files", "*.*")
-    ]
-    
-    TEXT_FILES = [
-        ("Text Files", "*.txt"),
-        ("All Files", "*.*")
-    ]
-    
-    CONFIG_FILES = [
-        ("Configuration Files", "*.json *.ini *.conf"),
-        ("JSON Files", "*.json"),
-        ("INI Files", "*.ini"),
-        ("All Files", "*.*")
-    ]
+    """File dialog filters (aliases of the module-level tuples)."""
+
+    AUDIO_FILES = AUDIO_FILE_FILTERS
+    TEXT_FILES = TEXT_FILE_FILTERS
+    CONFIG_FILES = CONFIG_FILE_FILTERS
 
 
 # Regular Expressions
@@ -343,3 +349,17 @@ class DevConstants:
     # Performance monitoring
     PERFORMANCE_THRESHOLD_MS = 1000  # 1 second
     MEMORY_USAGE_THRESHOLD_MB = 100  # 100 MB
+
+
+# Intern the user-facing message strings: CPython only auto-interns
+# identifier-like literals, so multi-word messages each held their own
+# allocation. Interned messages compare by pointer when matched against
+# status/log strings elsewhere in the app.
+import sys
+
+for _cls in (StatusMessages, ErrorMessages, SuccessMessages):
+    for _name, _value in vars(_cls).copy().items():
+        if not _name.startswith('_') and isinstance(_value, str):
+            setattr(_cls, _name, sys.intern(_value))
+
+del _cls, _name, _value
@@ -65,7 +65,7 @@ def setup_logging(
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
     except (OSError, IOError) as e:
-        logger.warning(f"Could not create file handler: {e}")
+        logger.warning("Could not create file handler: %s", e)
     
     # Prevent duplicate logs
     logger.propagate = False